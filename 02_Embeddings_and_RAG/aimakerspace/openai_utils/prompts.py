@@ -2,6 +2,10 @@ import re
 from typing import Dict, List, Any, Optional, Union, Callable
 from abc import ABC, abstractmethod
 
+_VARIABLE_PATTERN = re.compile(r'\{([^{}]+)\}')
+_CONDITIONAL_PATTERN = re.compile(r'\{if\s+([^}]+)\}(.*?)(?:\{else\}(.*?))?\{/if\}', re.DOTALL)
+_PLACEHOLDER_PATTERN = re.compile(r"\{([^}]+)\}")
+
 
 class PromptValidationError(Exception):
     """Raised when prompt validation fails"""
@@ -27,8 +31,6 @@ class ConditionalPrompt:
         self.prompt = prompt
         self.strict = strict
         self.defaults = defaults or {}
-        self._var_pattern = re.compile(r'\{([^{}]+)\}')
-        self._conditional_pattern = re.compile(r'\{if\s+([^}]+)\}(.*?)(?:\{else\}(.*?))?\{/if\}', re.DOTALL)
         
     def format_prompt(self, **kwargs) -> str:
         """Format prompt with conditional logic evaluation"""
@@ -38,19 +40,17 @@ class ConditionalPrompt:
         result = self._process_conditionals(self.prompt, merged_kwargs)
         
         # Process regular variables
-        variables = self._var_pattern.findall(result)
+        variables = _VARIABLE_PATTERN.findall(result)
         
         if self.strict:
             missing_vars = set(variables) - set(merged_kwargs.keys())
             if missing_vars:
                 raise PromptValidationError(f"Missing required variables: {missing_vars}")
         
-        # Format remaining variables
-        for var in variables:
-            value = merged_kwargs.get(var, "")
-            result = result.replace(f"{{{var}}}", str(value))
-            
-        return result
+        # Format remaining variables in a single pass over the text
+        return _VARIABLE_PATTERN.sub(
+            lambda match: str(merged_kwargs.get(match.group(1), "")), result
+        )
     
     def _process_conditionals(self, text: str, context: Dict[str, Any]) -> str:
         """Process conditional statements in the text"""
@@ -72,7 +72,7 @@ class ConditionalPrompt:
             except Exception:
                 return false_content
         
-        return self._conditional_pattern.sub(replace_conditional, text)
+        return _CONDITIONAL_PATTERN.sub(replace_conditional, text)
     
     def _evaluate_condition(self, condition: str, context: Dict[str, Any]) -> bool:
         """Evaluate simple conditions like 'var > 5' or 'var == "value"'"""
@@ -118,7 +118,6 @@ class BasePrompt:
         self.prompt = prompt
         self.strict = strict
         self.defaults = defaults or {}
-        self._pattern = re.compile(r"\{([^}]+)\}")
         self._validate_template()
 
     def _validate_template(self) -> None:
@@ -159,7 +158,7 @@ class BasePrompt:
 
         :return: List of input variable names
         """
-        return self._pattern.findall(self.prompt)
+        return _PLACEHOLDER_PATTERN.findall(self.prompt)
     
     def validate_inputs(self, **kwargs) -> Dict[str, List[str]]:
         """
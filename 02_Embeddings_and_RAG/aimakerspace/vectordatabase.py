@@ -1,6 +1,5 @@
 import numpy as np
-from collections import defaultdict
-from typing import List, Tuple, Callable
+from typing import Dict, List, Tuple, Callable
 from aimakerspace.openai_utils.embedding import EmbeddingModel
 import asyncio
 
@@ -15,7 +14,7 @@ def cosine_similarity(vector_a: np.array, vector_b: np.array) -> float:
 
 class VectorDatabase:
     def __init__(self, embedding_model: EmbeddingModel = None):
-        self.vectors = defaultdict(np.array)
+        self.vectors: Dict[str, np.array] = {}
         self.embedding_model = embedding_model or EmbeddingModel()
 
     def insert(self, key: str, vector: np.array) -> None:
@@ -1,25 +1,26 @@
 import re
 from typing import Any, Dict, List
 
+_PLACEHOLDER_PATTERN = re.compile(r"\{([^}]+)\}")
+
 
 class BasePrompt:
     """Simple string template helper used to format prompt text."""
 
     def __init__(self, prompt: str):
         self.prompt = prompt
-        self._pattern = re.compile(r"\{([^}]+)\}")
 
     def format_prompt(self, **kwargs: Any) -> str:
         """Return the prompt with ``kwargs`` substituted for placeholders."""
 
-        matches = self._pattern.findall(self.prompt)
+        matches = _PLACEHOLDER_PATTERN.findall(self.prompt)
         replacements = {match: kwargs.get(match, "") for match in matches}
         return self.prompt.format(**replacements)
 
     def get_input_variables(self) -> List[str]:
         """Return the placeholder names used by this prompt."""
 
-        return self._pattern.findall(self.prompt)
+        return _PLACEHOLDER_PATTERN.findall(self.prompt)
 
 
 class RolePrompt(BasePrompt):
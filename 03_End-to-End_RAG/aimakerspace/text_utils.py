@@ -1,5 +1,6 @@
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 import PyPDF2
 
@@ -70,8 +71,15 @@ class CharacterTextSplitter:
     def split(self, text: str) -> List[str]:
         """Split ``text`` into chunks preserving the configured overlap."""
 
-        step = self.chunk_size - self.chunk_overlap
-        return [text[i : i + self.chunk_size] for i in range(0, len(text), step)]
+        if not text:
+            return []
+
+        chunk_size, chunk_overlap = self.chunk_size, self.chunk_overlap
+        step = chunk_size - chunk_overlap
+        # A window starting within ``chunk_overlap`` of the end would only repeat
+        # the tail of the previous chunk, so stop before emitting it.
+        stop = max(len(text) - chunk_overlap, 1)
+        return [text[i : i + chunk_size] for i in range(0, stop, step)]
 
     def split_texts(self, texts: List[str]) -> List[str]:
         """Split multiple texts and flatten the resulting chunks."""
@@ -82,11 +90,23 @@ class CharacterTextSplitter:
         return chunks
 
 
+def _read_pdf(file_path: Path) -> str:
+    """Extract the text of every page in the PDF at ``file_path``."""
+
+    with file_path.open("rb") as file_handle:
+        pdf_reader = PyPDF2.PdfReader(file_handle)
+        extracted_pages = [page.extract_text() or "" for page in pdf_reader.pages]
+    return "\n".join(extracted_pages)
+
+
 class PDFLoader:
     """Extract text from PDF files stored at a path."""
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, max_workers: Optional[int] = None):
+        """Set ``max_workers`` above 1 to parse directories in a process pool."""
+
         self.path = Path(path)
+        self.max_workers = max_workers
         self.documents: List[str] = []
 
     def load(self) -> None:
@@ -97,7 +117,7 @@ class PDFLoader:
     def load_file(self) -> None:
         """Load a single PDF specified by ``self.path``."""
 
-        self.documents = [self._read_pdf(self.path)]
+        self.documents = [_read_pdf(self.path)]
 
     def load_directory(self) -> None:
         """Load all PDF files contained within ``self.path``."""
@@ -114,22 +134,20 @@ class PDFLoader:
         if self.path.is_dir():
             yield from self._iter_directory(self.path)
         elif self.path.is_file() and self.path.suffix.lower() == ".pdf":
-            yield self._read_pdf(self.path)
+            yield _read_pdf(self.path)
         else:
             raise ValueError(
                 "Provided path must be a directory or a .pdf file: " f"{self.path}"
             )
 
     def _iter_directory(self, directory: Path) -> Iterable[str]:
-        for entry in sorted(directory.rglob("*.pdf")):
-            if entry.is_file():
-                yield self._read_pdf(entry)
+        paths = [entry for entry in sorted(directory.rglob("*.pdf")) if entry.is_file()]
+        if self.max_workers is None or self.max_workers <= 1 or len(paths) < 2:
+            yield from map(_read_pdf, paths)
+            return
 
-    def _read_pdf(self, file_path: Path) -> str:
-        with file_path.open("rb") as file_handle:
-            pdf_reader = PyPDF2.PdfReader(file_handle)
-            extracted_pages = [page.extract_text() or "" for page in pdf_reader.pages]
-        return "\n".join(extracted_pages)
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from executor.map(_read_pdf, paths)
 
 
 if __name__ == "__main__":
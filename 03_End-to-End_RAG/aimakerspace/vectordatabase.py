@@ -1,34 +1,249 @@
 import asyncio
-from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Literal, Optional, Tuple, Union
 
 import numpy as np
 
 from aimakerspace.openai_utils.embedding import EmbeddingModel
 
+try:
+    import simsimd
+except ImportError:  # optional SIMD kernels, numpy is used when unavailable
+    simsimd = None
+
+njit = None
+if simsimd is None:
+    try:
+        from numba import njit
+    except ImportError:  # optional JIT for the scalar cosine when simsimd is missing
+        pass
+
+try:
+    import faiss
+except ImportError:  # optional index backend, see ``VectorDatabase(index_type=...)``
+    faiss = None
+
+
+if njit is not None:
+
+    # Compiled on first call for each input dtype, so importing this module never
+    # pays for the JIT; ``cache=True`` reuses the machine code across processes.
+    @njit(fastmath=True, boundscheck=False, cache=True)
+    def _numba_cosine(vector_a, vector_b):
+        dot_product = 0.0
+        squared_norm_a = 0.0
+        squared_norm_b = 0.0
+        for index in range(vector_a.shape[0]):
+            dot_product += vector_a[index] * vector_b[index]
+            squared_norm_a += vector_a[index] * vector_a[index]
+            squared_norm_b += vector_b[index] * vector_b[index]
+        if squared_norm_a == 0 or squared_norm_b == 0:
+            return 0.0
+        return dot_product / np.sqrt(squared_norm_a * squared_norm_b)
+
+else:
+    _numba_cosine = None
+
+
+def _as_float_pair(
+    vector_a: np.ndarray, vector_b: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return both vectors as contiguous arrays of one float dtype.
+
+    Float inputs that already share a dtype are passed through without a copy.
+    """
+
+    vector_a = np.asarray(vector_a)
+    vector_b = np.asarray(vector_b)
+    if vector_a.dtype != vector_b.dtype or vector_a.dtype.kind != "f":
+        dtype = np.result_type(vector_a.dtype, vector_b.dtype, np.float32)
+        vector_a = vector_a.astype(dtype)
+        vector_b = vector_b.astype(dtype)
+    return np.ascontiguousarray(vector_a), np.ascontiguousarray(vector_b)
+
 
 def cosine_similarity(vector_a: np.ndarray, vector_b: np.ndarray) -> float:
     """Return the cosine similarity between two vectors."""
 
-    norm_a = np.linalg.norm(vector_a)
-    norm_b = np.linalg.norm(vector_b)
-    if norm_a == 0 or norm_b == 0:
+    if simsimd is not None:
+        vector_a, vector_b = _as_float_pair(vector_a, vector_b)
+        distance = simsimd.cosine(vector_a, vector_b)
+        # simsimd reports two zero vectors as identical; keep them at 0.0.
+        if distance == 0.0 and (not vector_a.any() or not vector_b.any()):
+            return 0.0
+        return float(1.0 - distance)
+
+    if _numba_cosine is not None:
+        vector_a, vector_b = _as_float_pair(vector_a, vector_b)
+        if vector_a.ndim != 1 or vector_a.shape != vector_b.shape:
+            raise ValueError("Vectors must be one-dimensional and of equal length")
+        return float(_numba_cosine(vector_a, vector_b))
+
+    squared_norms = np.vdot(vector_a, vector_a) * np.vdot(vector_b, vector_b)
+    if squared_norms == 0:
         return 0.0
 
     dot_product = np.dot(vector_a, vector_b)
-    return float(dot_product / (norm_a * norm_b))
+    return float(dot_product / np.sqrt(squared_norms))
+
+
+def dot_product_similarity(vector_a: np.ndarray, vector_b: np.ndarray) -> float:
+    """Return the inner product of two vectors."""
+
+    return float(np.dot(vector_a, vector_b))
+
+
+# Rows of int8 codes converted to float32 per step by the numpy int8 fallback.
+_INT8_BLOCK_ROWS = 256
+
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    norm = np.sqrt(np.vdot(vector, vector))
+    if norm == 0:
+        return vector
+    return vector / norm
+
+
+def _quantize(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetrically quantize ``vectors`` to int8 along the last axis.
+
+    Returns the int8 codes and the per-vector scale that maps them back.
+    """
+
+    scales = np.max(np.abs(vectors), axis=-1) / 127
+    scales = np.where(scales == 0, 1, scales).astype(np.float32)
+    return np.round(vectors / scales[..., None]).astype(np.int8), scales
+
+
+def _top_k(keys: List[str], scores: np.ndarray, k: int) -> List[Tuple[str, float]]:
+    """Return the ``k`` highest scoring ``(key, score)`` pairs, best first."""
+
+    size = len(keys)
+    if size == 0:
+        return []
+
+    k = min(k, size)
+    # Keep the stable-sort behaviour of ties going to the earliest inserted
+    # rows: take everything above the k-th best score, fill up with the lowest
+    # indices tied at it, then order the winners by score without reordering ties.
+    kth_score = np.partition(scores, size - k)[size - k]
+    above = np.flatnonzero(scores > kth_score)
+    tied = np.flatnonzero(scores == kth_score)[: k - above.size]
+    top = np.concatenate((above, tied))
+    top = top[np.argsort(-scores[top], kind="stable")]
+    return [(keys[index], float(scores[index])) for index in top]
 
 
 class VectorDatabase:
-    """Minimal in-memory vector store backed by numpy arrays."""
+    """Minimal in-memory vector store backed by numpy arrays.
+
+    By default cosine search is an exact scan over the stored matrix. With
+    ``index_type="flat"`` (exact) or ``"hnsw"`` (approximate) it is served by a
+    FAISS inner-product index instead, which requires ``faiss`` to be installed.
+    The index holds its own float32 copy of every row, so it roughly doubles
+    the memory used by the stored vectors and is not available together with
+    ``precision="i8"``.
+    """
+
+    def __init__(
+        self,
+        embedding_model: Optional[EmbeddingModel] = None,
+        precision: Literal["f32", "i8"] = "f32",
+        index_type: Literal["numpy", "flat", "hnsw"] = "numpy",
+    ):
+        if precision not in ("f32", "i8"):
+            raise ValueError("precision must be either 'f32' or 'i8'")
+        if index_type not in ("numpy", "flat", "hnsw"):
+            raise ValueError("index_type must be one of 'numpy', 'flat' or 'hnsw'")
+        if index_type != "numpy" and faiss is None:
+            raise ImportError(
+                f"index_type={index_type!r} requires faiss to be installed"
+            )
+        if index_type != "numpy" and precision == "i8":
+            raise ValueError(
+                f"index_type={index_type!r} stores float32 rows and cannot be "
+                "combined with precision='i8'"
+            )
 
-    def __init__(self, embedding_model: Optional[EmbeddingModel] = None):
-        self.vectors: Dict[str, np.ndarray] = {}
         self.embedding_model = embedding_model or EmbeddingModel()
+        self.precision = precision
+        self.index_type = index_type
+        # Stored vectors live in one contiguous matrix of unit-length rows, so
+        # cosine search is a single matrix-vector product; ``self._row_norms``
+        # keeps the original lengths. Rows beyond ``len(self._keys)`` are spare
+        # capacity. With ``precision="i8"`` rows hold int8 codes and
+        # ``self._scales`` the per-row dequantization factor.
+        self._matrix = np.empty(
+            (0, 0), dtype=np.int8 if precision == "i8" else np.float32
+        )
+        self._row_norms = np.empty(0, dtype=np.float32)
+        self._scales = np.empty(0, dtype=np.float32)
+        self._keys: List[str] = []
+        self._key_to_row: Dict[str, int] = {}
+        # FAISS index over the first ``self._indexed_rows`` rows, built lazily on
+        # search and discarded when an already indexed row is overwritten.
+        self._index = None
+        self._indexed_rows = 0
 
     def insert(self, key: str, vector: Iterable[float]) -> None:
         """Store ``vector`` so that it can be retrieved with ``key`` later on."""
 
-        self.vectors[key] = np.asarray(vector, dtype=float)
+        self._bulk_insert([key], np.asarray(vector, dtype=np.float32)[None, :])
+
+    def _bulk_insert(self, keys: List[str], vectors: np.ndarray) -> None:
+        """Store the rows of ``vectors`` under ``keys`` with one block assignment."""
+
+        new_keys = [key for key in dict.fromkeys(keys) if key not in self._key_to_row]
+        self._reserve(len(self._keys) + len(new_keys), vectors.shape[1])
+        for key in new_keys:
+            self._key_to_row[key] = len(self._keys)
+            self._keys.append(key)
+        rows = [self._key_to_row[key] for key in keys]
+        if rows and min(rows) < self._indexed_rows:
+            self._index = None
+            self._indexed_rows = 0
+
+        norms = np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
+        units = vectors / np.where(norms == 0, 1, norms)[:, None]
+        self._row_norms[rows] = norms
+        if self.precision == "i8":
+            self._matrix[rows], self._scales[rows] = _quantize(units)
+        else:
+            self._matrix[rows] = units
+
+    def _reserve(self, rows: int, dimension: int) -> None:
+        """Grow ``self._matrix`` geometrically so it can hold ``rows`` vectors."""
+
+        capacity, current_dimension = self._matrix.shape
+        if self._keys and dimension != current_dimension:
+            raise ValueError(
+                f"Expected vectors of dimension {current_dimension}, got {dimension}"
+            )
+        if rows <= capacity and dimension == current_dimension:
+            return
+
+        grown = np.empty((max(rows, 2 * capacity), dimension), dtype=self._matrix.dtype)
+        if self._keys:
+            grown[: len(self._keys)] = self._matrix[: len(self._keys)]
+        self._matrix = grown
+        self._row_norms = np.resize(self._row_norms, grown.shape[0])
+        if self.precision == "i8":
+            self._scales = np.resize(self._scales, grown.shape[0])
+
+    def _stored_vectors(self, rows: Union[int, slice]) -> np.ndarray:
+        """Rebuild float32 vector(s) for ``rows`` from the unit rows and norms.
+
+        The result matches the inserted vector up to float32 rounding, and is a
+        lossy approximation when ``precision="i8"``. Custom distance measures
+        passed to ``search`` are evaluated against these rebuilt vectors.
+        """
+
+        vectors = self._matrix[rows].astype(np.float32, copy=False)
+        scales = self._row_norms[rows]
+        if self.precision == "i8":
+            scales = scales * self._scales[rows]
+        if isinstance(rows, slice):
+            scales = scales[:, None]
+        return vectors * scales
 
     def search(
         self,
@@ -42,12 +257,99 @@ class VectorDatabase:
             raise ValueError("k must be a positive integer")
 
         query = np.asarray(query_vector, dtype=float)
-        scores = [
-            (key, distance_measure(query, vector))
-            for key, vector in self.vectors.items()
+        size = len(self._keys)
+        if distance_measure is cosine_similarity:
+            if self.index_type != "numpy" and size > 0:
+                return self._search_index(query, k)
+            return _top_k(self._keys, self._cosine_scores(query), k)
+        if distance_measure is dot_product_similarity:
+            # v . q == |v| |q| cos(v, q), and |v| is cached per row on insert.
+            query_norm = np.sqrt(np.vdot(query, query))
+            scores = self._cosine_scores(query) * (self._row_norms[:size] * query_norm)
+            return _top_k(self._keys, scores, k)
+
+        vectors = self._stored_vectors(slice(0, size))
+        scores = np.fromiter(
+            (distance_measure(query, vector) for vector in vectors),
+            dtype=float,
+            count=size,
+        )
+        return _top_k(self._keys, scores, k)
+
+    def _cosine_scores(self, query: np.ndarray) -> np.ndarray:
+        """Score every stored vector against ``query`` with one matrix product."""
+
+        size = len(self._keys)
+        if size == 0:
+            return np.empty(0, dtype=np.float32)
+
+        unit_query = _normalize(query).astype(np.float32)
+        if self.precision == "i8":
+            scores = self._int8_cosine_scores(unit_query, size)
+        elif simsimd is not None:
+            # Rows are already unit length, so the inner product is the cosine.
+            distances = simsimd.cdist(
+                unit_query[None, :], self._matrix[:size], metric="dot"
+            )
+            scores = np.asarray(distances)[0]
+        else:
+            # einsum reduces every row the same way; a BLAS GEMV can score
+            # identical rows an ulp apart and break ties out of insertion order.
+            scores = np.einsum("ij,j->i", self._matrix[:size], unit_query)
+
+        return scores
+
+    def _search_index(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """Cosine search through the FAISS index, adding any new rows first."""
+
+        size = len(self._keys)
+        if self._index is None:
+            dimension = self._matrix.shape[1]
+            if self.index_type == "flat":
+                self._index = faiss.IndexFlatIP(dimension)
+            else:
+                self._index = faiss.IndexHNSWFlat(
+                    dimension, 32, faiss.METRIC_INNER_PRODUCT
+                )
+                self._index.hnsw.efSearch = 64
+        if self._indexed_rows < size:
+            self._index.add(self._matrix[self._indexed_rows : size])
+            self._indexed_rows = size
+
+        unit_query = _normalize(query).astype(np.float32)
+        scores, rows = self._index.search(unit_query[None, :], min(k, size))
+        return [
+            (self._keys[row], float(score))
+            for score, row in zip(scores[0], rows[0])
+            if row >= 0
         ]
-        scores.sort(key=lambda item: item[1], reverse=True)
-        return scores[:k]
+
+    def _int8_cosine_scores(self, unit_query: np.ndarray, size: int) -> np.ndarray:
+        """Cosine scores of ``unit_query`` against the int8-quantized rows."""
+
+        if simsimd is not None:
+            if not unit_query.any():
+                return np.zeros(size, dtype=np.float32)
+            # Per-vector scales cancel out of the cosine, so compare codes directly.
+            codes, _ = _quantize(unit_query)
+            distances = simsimd.cdist(
+                codes[None, :], self._matrix[:size], metric="cosine"
+            )
+            scores = 1.0 - np.asarray(distances)[0]
+            # Zero vectors have no direction; score them 0 as the f32 path does.
+            scores[self._row_norms[:size] == 0] = 0.0
+            return scores
+
+        # Cast a cache-sized block of codes at a time rather than the whole
+        # matrix, so the fallback never allocates an N x D float32 temporary.
+        scores = np.empty(size, dtype=np.float32)
+        block = np.empty((min(size, _INT8_BLOCK_ROWS), unit_query.shape[0]), np.float32)
+        for start in range(0, size, _INT8_BLOCK_ROWS):
+            stop = min(start + _INT8_BLOCK_ROWS, size)
+            rows = block[: stop - start]
+            np.copyto(rows, self._matrix[start:stop], casting="unsafe")
+            np.einsum("ij,j->i", rows, unit_query, out=scores[start:stop])
+        return scores * self._scales[:size]
 
     def search_by_text(
         self,
@@ -65,16 +367,50 @@ class VectorDatabase:
         return results
 
     def retrieve_from_key(self, key: str) -> Optional[np.ndarray]:
-        """Return the stored vector for ``key`` if present."""
+        """Return the stored vector for ``key`` if present.
+
+        The vector is rebuilt as float32 from the stored row, so it is only
+        approximately the inserted one when ``precision="i8"``.
+        """
 
-        return self.vectors.get(key)
+        row = self._key_to_row.get(key)
+        if row is None:
+            return None
+        return self._stored_vectors(row)
+
+    async def abuild_from_list(
+        self,
+        list_of_text: List[str],
+        batch_size: int = 256,
+        max_concurrency: int = 4,
+    ) -> "VectorDatabase":
+        """Populate the vector store asynchronously from raw text snippets.
 
-    async def abuild_from_list(self, list_of_text: List[str]) -> "VectorDatabase":
-        """Populate the vector store asynchronously from raw text snippets."""
+        Texts are embedded in batches of ``batch_size`` with at most
+        ``max_concurrency`` requests in flight. Batches are inserted in input
+        order as their embeddings arrive, and if any request fails the
+        outstanding ones are cancelled.
+        """
 
-        embeddings = await self.embedding_model.async_get_embeddings(list_of_text)
-        for text, embedding in zip(list_of_text, embeddings):
-            self.insert(text, embedding)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def embed(batch: List[str]) -> Tuple[List[str], List[List[float]]]:
+            async with semaphore:
+                return batch, await self.embedding_model.async_get_embeddings(batch)
+
+        batches = [
+            list_of_text[i : i + batch_size]
+            for i in range(0, len(list_of_text), batch_size)
+        ]
+        tasks = [asyncio.ensure_future(embed(batch)) for batch in batches]
+        try:
+            for task in tasks:
+                batch, embeddings = await task
+                self._bulk_insert(batch, np.asarray(embeddings, dtype=np.float32))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
         return self
 
 